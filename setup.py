@@ -68,9 +68,7 @@ setup(
         'scipy >= 1.7.0',
     ],
     extras_require={
-        # eg:
-        #   'rst': ['docutils>=0.11'],
-        #   ':python_version=="2.6"': ['argparse'],
+        'numba': ['numba >= 0.53.0'],
     },
     setup_requires=[
         'setuptools_scm>=3.3.1',
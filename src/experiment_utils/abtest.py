@@ -1,13 +1,206 @@
 """Utilities for A/B test."""
 
+import logging
 from collections import namedtuple
+from functools import lru_cache
+from math import sqrt
 
 import numpy as np
-from scipy.stats import norm, t
+from scipy.special import ndtri
+from scipy.special import stdtrit
+
+logger = logging.getLogger(__name__)
+
+CIRange = namedtuple('CIRange', ('lower', 'upper'))
+ABResult = namedtuple('ABResult', ('stat_significant', 'practical_significant', 'd_obs', 'ci_lower', 'ci_upper'))
+
+# significance check of a confidence interval against a benchmark, per test type
+_SIGNIFICANCE_TESTS = {
+    "two-tailed": lambda ci, benchmark: bool((ci.lower > benchmark) | (ci.upper < benchmark)),
+    "right-tailed": lambda ci, benchmark: bool(ci.lower > benchmark),
+    "left-tailed": lambda ci, benchmark: bool(ci.upper < benchmark),
+}
+
+
+def _n_mean_var(arr):
+    """Calculate size, mean and population variance of a sample.
+
+    NumPy's two-pass variance keeps its precision when the mean is large relative to the spread.
+    Integer and bool samples are accumulated in float64; float samples in their own dtype.
+
+    Args:
+        arr (array-like): Values of the sample.
+
+    Returns:
+        n (int): sample size.
+        mean (float): sample mean.
+        var (float): population variance (ddof=0) of the sample.
+    """
+    arr = np.asarray(arr).ravel()
+    return arr.size, arr.mean(), arr.var()
+
+
+@lru_cache(maxsize=4096)
+def _t_crit_cached(degree_of_freedom, level):
+    """Calculate quantile of Student's t distribution, memoized on degree of freedom and level.
+
+    Args:
+        degree_of_freedom (float): degree of freedom.
+        level (float): quantile level.
+
+    Returns:
+        t_crit (float): critical value of t distribution.
+    """
+    return stdtrit(degree_of_freedom, level)
+
+
+def _check_sample_sizes(N_exp, N_ctrl):
+    """Check that two samples are large enough for a pooled t-test.
+
+    Args:
+        N_exp (int): Total number of samples in treatment group.
+        N_ctrl (int): Total number of samples in control group.
+
+    Returns:
+        None.
+    """
+    if N_exp < 1 or N_ctrl < 1:
+        raise ValueError("Each group should have at least one sample.")
+    if N_exp + N_ctrl < 3:
+        raise ValueError("Groups should have at least three samples in total.")
+
+
+def _check_scalar_counts(X_exp, X_ctrl, N_exp, N_ctrl):
+    """Check that scalar counts are nonnegative integers with positives no more than totals.
+
+    Plain Python comparisons are much cheaper than building an array for four scalars;
+    `_check_counts` handles arrays of counts.
+
+    Args:
+        X_exp (int): Number of positive in treatment group.
+        X_ctrl (int): Number of positive in control group.
+        N_exp (int): Total number of samples in treatment group.
+        N_ctrl (int): Total number of samples in control group.
+
+    Returns:
+        None.
+    """
+    inputs = (X_exp, X_ctrl, N_exp, N_ctrl)
+
+    # check for negative or non-integer values
+    try:
+        valid = all(i >= 0 and int(i) == i for i in inputs)
+    except (ValueError, OverflowError, TypeError):  # nan, inf or non-numeric
+        valid = False
+    if not valid:
+        raise ValueError("All inputs should be nonnegative integers.")
+
+    # check for valid probability
+    if X_exp > N_exp or X_ctrl > N_ctrl:
+        raise ValueError("Positive samples should not be greater than total samples.")
+
+
+def _check_counts(X_exp, X_ctrl, N_exp, N_ctrl):
+    """Check that counts are nonnegative integers with positives no more than totals.
+
+    Args:
+        X_exp (int or array-like): Number of positive in treatment group.
+        X_ctrl (int or array-like): Number of positive in control group.
+        N_exp (int or array-like): Total number of samples in treatment group.
+        N_ctrl (int or array-like): Total number of samples in control group.
+
+    Returns:
+        None.
+    """
+    inputs = np.asarray([X_exp, X_ctrl, N_exp, N_ctrl])
+
+    # non-numeric dtype, e.g. object arrays from Python ints beyond the int64 range
+    if inputs.dtype.kind not in "biuf":
+        raise ValueError("All inputs should be nonnegative integers within the int64 range.")
+
+    # check for negative or non-integer values
+    if (inputs < 0).any() or not (np.issubdtype(inputs.dtype, np.integer)
+                                  or (np.isfinite(inputs).all() and np.array_equal(inputs, np.floor(inputs)))):
+        raise ValueError("All inputs should be nonnegative integers.")
+
+    # check for valid probability
+    if (inputs[0] > inputs[2]).any() or (inputs[1] > inputs[3]).any():
+        raise ValueError("Positive samples should not be greater than total samples.")
+
+
+def _prob_diff_kernel(X_exp, X_ctrl, N_exp, N_ctrl):
+    """Calculate observed probabilities, their difference and its pooled variance.
+
+    Only arithmetic operators are used, so the same code serves scalar counts and arrays of counts;
+    callers take the square root for the standard error.
+
+    Args:
+        X_exp (int or np.ndarray): Number of positive in treatment group.
+        X_ctrl (int or np.ndarray): Number of positive in control group.
+        N_exp (int or np.ndarray): Total number of samples in treatment group.
+        N_ctrl (int or np.ndarray): Total number of samples in control group.
+
+    Returns:
+        p_exp (float or np.ndarray): observed probability in treatment group.
+        p_ctrl (float or np.ndarray): observed probability in control group.
+        d_obs (float or np.ndarray): observed difference in probability.
+        pooled_var (float or np.ndarray): pooled variance of the difference.
+    """
+    N_sum = N_exp + N_ctrl
+    inv_N = 1.0/N_exp + 1.0/N_ctrl
+
+    p_exp = X_exp / N_exp
+    p_ctrl = X_ctrl / N_ctrl
+    d_obs = p_exp - p_ctrl
+    # pooled p * (1 - p) from integer counts, so 1 - p is not formed by cancellation
+    X_sum = X_exp + X_ctrl
+    pooled_var = (X_sum / N_sum) * ((N_sum - X_sum) / N_sum) * inv_N
+    return p_exp, p_ctrl, d_obs, pooled_var
+
+
+def _cuped_adjust(arr_exp, arr_ctrl, cov_exp, cov_ctrl):
+    """Adjust outcomes with pre-experiment covariates (CUPED).
+
+    The adjustment `Y - theta * (X - mean(X))` uses `theta = cov(Y, X) / var(X)` and `mean(X)`
+    pooled across both groups, so it leaves the expected difference in means unchanged while
+    removing the variance explained by the covariate.
+
+    Args:
+        arr_exp (np.ndarray): Values of sample 1.
+        arr_ctrl (np.ndarray): Values of sample 2.
+        cov_exp (array-like): Pre-experiment covariate of sample 1, same length as `arr_exp`.
+        cov_ctrl (array-like): Pre-experiment covariate of sample 2, same length as `arr_ctrl`.
+
+    Returns:
+        adjusted_exp (np.ndarray): adjusted values of sample 1.
+        adjusted_ctrl (np.ndarray): adjusted values of sample 2.
+    """
+    y_exp, y_ctrl = (np.asarray(a, dtype=np.float64).ravel() for a in (arr_exp, arr_ctrl))
+    x_exp, x_ctrl = (np.asarray(a, dtype=np.float64).ravel() for a in (cov_exp, cov_ctrl))
+    if x_exp.shape != y_exp.shape or x_ctrl.shape != y_ctrl.shape:
+        raise ValueError("Covariates should have the same length as the samples.")
+
+    n = y_exp.size + y_ctrl.size
+    mu_x = (x_exp.sum() + x_ctrl.sum()) / n
+    mu_y = (y_exp.sum() + y_ctrl.sum()) / n
+
+    # center on pooled means so the products do not cancel when the means dominate the spread
+    dx_exp, dx_ctrl = x_exp - mu_x, x_ctrl - mu_x
+    dy_exp, dy_ctrl = y_exp - mu_y, y_ctrl - mu_y
+    sxx = np.einsum('i,i->', dx_exp, dx_exp) + np.einsum('i,i->', dx_ctrl, dx_ctrl)
+    sxy = np.einsum('i,i->', dx_exp, dy_exp) + np.einsum('i,i->', dx_ctrl, dy_ctrl)
+
+    if sxx <= 0:
+        raise ValueError("Covariates should not be constant.")
+    theta = sxy / sxx
+
+    return y_exp - theta * dx_exp, y_ctrl - theta * dx_ctrl
 
 
 class ABTest():
     """Class for A/B test."""
+
+    __slots__ = ('_alpha', '_type', '_conf_level', '_z_crit', '_sig_fn')
     
     def __init__(self, alpha=0.05, type="two-tailed"):
         """Initiate the class.
@@ -32,8 +225,18 @@ class ABTest():
         else:
             raise ValueError("Test `type` provided is not a valid option.")
 
+        # quantile level of the critical value, fixed by alpha and test type
+        if self._type == "two-tailed":
+            self._conf_level = 1 - self._alpha/2
+        else:
+            self._conf_level = 1 - self._alpha
+        self._z_crit = ndtri(self._conf_level)
+        self._sig_fn = _SIGNIFICANCE_TESTS[self._type]
+
     def _get_pooled_prob(self, X_exp, X_ctrl, N_exp, N_ctrl):
         """Calculate pooled probability.
+
+        `test_prob` computes this inline in `_prob_diff_kernel`; kept for standalone use.
         
         Args:
             X_exp (int): Number of positive in treatment group.
@@ -50,6 +253,8 @@ class ABTest():
     def _get_pooled_se(self, pooled_p, N_exp, N_ctrl):
         """Calculate pooled standard error.
 
+        `test_prob` computes this inline in `_prob_diff_kernel`; kept for standalone use.
+
         Args:
             pooled_p (float): pooled probability.
             N_exp (int): Total number of samples in treatment group.
@@ -58,7 +263,7 @@ class ABTest():
         Returns:
             pooled_se (float): pooled standard error.
         """
-        pooled_se = np.sqrt(pooled_p * (1 - pooled_p) * (1/N_exp + 1/N_ctrl))
+        pooled_se = sqrt(pooled_p * (1 - pooled_p) * (1/N_exp + 1/N_ctrl))
         return pooled_se
 
     def _get_z_confidence_interval(self, point_estimate, standard_error):
@@ -69,23 +274,20 @@ class ABTest():
             standard_error (float): estimated standard error.
 
         Returns:
-            confidence_interval (namedtuple): lower and upper bound of confidence interval.
+            confidence_interval (CIRange): lower and upper bound of confidence interval.
         """
+        z_abs = self._z_crit
         if self._type == "two-tailed":
-            z_abs = norm.ppf(1 - self._alpha/2)
             lower = point_estimate - z_abs * standard_error
             upper = point_estimate + z_abs * standard_error
         elif self._type == "right-tailed": # test if increase
-            z_abs = norm.ppf(1 - self._alpha)
             lower = -np.inf
             upper = point_estimate + z_abs * standard_error
         elif self._type == "left-tailed": # test if decrease
-            z_abs = norm.ppf(1 - self._alpha)
             lower = point_estimate - z_abs * standard_error
             upper = np.inf
 
-        range_tuple = namedtuple('range_tuple', 'lower upper')
-        confidence_interval = range_tuple(lower, upper)
+        confidence_interval = CIRange(lower, upper)
         return confidence_interval
 
     def _get_t_confidence_interval(self, point_estimate, standard_error, degree_of_freedom):
@@ -97,53 +299,63 @@ class ABTest():
             degree_of_freedom (float): degree of freedom.
 
         Returns:
-            confidence_interval (namedtuple): lower and upper bound of confidence interval.
+            confidence_interval (CIRange): lower and upper bound of confidence interval.
         """
+        t_abs = _t_crit_cached(degree_of_freedom, self._conf_level)
         if self._type == "two-tailed":
-            t_abs = t.ppf(1 - self._alpha/2, degree_of_freedom)
             lower = point_estimate - t_abs * standard_error
             upper = point_estimate + t_abs * standard_error
         elif self._type == "right-tailed": # test if increase
-            t_abs = norm.ppf(1 - self._alpha, degree_of_freedom)
             lower = -np.inf
             upper = point_estimate + t_abs * standard_error
         elif self._type == "left-tailed": # test if decrease
-            t_abs = norm.ppf(1 - self._alpha, degree_of_freedom)
             lower = point_estimate - t_abs * standard_error
             upper = np.inf
 
-        range_tuple = namedtuple('range_tuple', 'lower upper')
-        confidence_interval = range_tuple(lower, upper)
+        confidence_interval = CIRange(lower, upper)
         return confidence_interval
 
     def _get_significance(self, confidence_interval, benchmark):
         """Check whether the outcome is statistically signficant.
         
         Args:
-            confidence_interval (namedtuple): confidence interval with upper and lower bound.
+            confidence_interval (CIRange): confidence interval with upper and lower bound.
             benchmark (float): benchmark to determine significance.
         
         Returns:
             significant (bool): Whether the outcome is significant.
         """
+        return self._sig_fn(confidence_interval, benchmark)
+        
+    def _get_batch_significance(self, d_obs, margin, practical_diff):
+        """Calculate confidence intervals and significance for arrays of observed differences.
+
+        Args:
+            d_obs (np.ndarray): observed differences.
+            margin (np.ndarray): critical value times standard error of each difference.
+            practical_diff (float or array-like): Difference required to reach practical significance of the test.
+
+        Returns:
+            lower (np.ndarray): lower bounds of confidence intervals.
+            upper (np.ndarray): upper bounds of confidence intervals.
+            stat_significant (np.ndarray): Whether each difference is statistically significant.
+            practical_significant (np.ndarray): Whether each difference is practically significant.
+        """
         if self._type == "two-tailed":
-            if confidence_interval.lower > benchmark or confidence_interval.upper < benchmark:
-                significant = True
-            else:
-                significant = False
+            lower, upper = d_obs - margin, d_obs + margin
+            stat_significant = (lower > 0.0) | (upper < 0.0)
+            practical_significant = (lower > practical_diff) | (upper < practical_diff)
         elif self._type == "right-tailed":
-            if confidence_interval.lower > benchmark:
-                significant = True
-            else:
-                significant = False
+            lower, upper = np.full(np.shape(d_obs), -np.inf), d_obs + margin
+            stat_significant = lower > 0.0
+            practical_significant = lower > practical_diff
         elif self._type == "left-tailed":
-            if confidence_interval.upper < benchmark:
-                significant = True
-            else:
-                significant = False
+            lower, upper = d_obs - margin, np.full(np.shape(d_obs), np.inf)
+            stat_significant = upper < 0.0
+            practical_significant = upper < practical_diff
+
+        return lower, upper, stat_significant, practical_significant
 
-        return significant
-        
     def test_prob(self, X_exp, X_ctrl, N_exp, N_ctrl, practical_diff=0.0, verbose=0):
         """Perform A/B test on probability.
         
@@ -153,27 +365,18 @@ class ABTest():
             N_exp (int): Total number of samples in treatment group.
             N_ctrl (int): Total number of samples in control group.
             practical_diff (float): Difference required to reach practical significance of the test.
-            verbose (int): Whether to print metrics and test stats.
+            verbose (int): Whether to log metrics and test stats at INFO level on the `experiment_utils.abtest`
+                logger. Nothing is shown unless logging is configured, e.g. `logging.basicConfig(level=logging.INFO)`.
 
         Returns:
-            stat_significant (bool): Whether the difference is statistically significant.
-            practical_significant (bool): Whether the difference is practically significant.
+            result (ABResult): Whether the difference is statistically and practically significant,
+                the observed difference and its confidence interval. Unpack the flags with
+                `result.stat_significant, result.practical_significant` or `result[:2]`.
         """
-        inputs = [X_exp, X_ctrl, N_exp, N_ctrl]
-
-        # check for negative or non-integer values
-        if any(i < 0 for i in inputs) or not all(int(i) == i for i in inputs):
-            raise ValueError("All inputs should be nonnegative integers.")
-        
-        # check for valid probability
-        if X_exp > N_exp or X_ctrl > N_ctrl:
-            raise ValueError("Positive samples should not be greater than total samples.")
+        _check_scalar_counts(X_exp, X_ctrl, N_exp, N_ctrl)
 
-        p_exp, p_ctrl = X_exp / N_exp, X_ctrl / N_ctrl
-        d_obs = p_exp - p_ctrl
-
-        pooled_p = self._get_pooled_prob(X_exp, X_ctrl, N_exp, N_ctrl)
-        pooled_se = self._get_pooled_se(pooled_p=pooled_p, N_exp=N_exp, N_ctrl=N_ctrl)
+        p_exp, p_ctrl, d_obs, pooled_var = _prob_diff_kernel(X_exp, X_ctrl, N_exp, N_ctrl)
+        pooled_se = sqrt(pooled_var)
 
         d_interval = self._get_z_confidence_interval(point_estimate=d_obs, 
                                                    standard_error=pooled_se)
@@ -182,57 +385,167 @@ class ABTest():
         practical_signficant = self._get_significance(d_interval, practical_diff)
 
         if verbose > 0:
-            print(f'Sample size in treatment group: {int(N_exp)}')
-            print(f'Observed probability in treatment group: {p_exp:.2%}\n')
-            print(f'Sample size in control group: {int(N_ctrl)}')
-            print(f'Observed probability in control group: {p_ctrl:.2%}\n')
-            print(f'Observed difference in probability (treatment - control): {d_obs:.2%}')
-            print(f'Confidence interval for probability diff: ({d_interval.lower:.2%}, {d_interval.upper:.2%})\n')
-
-        print(f'Is the test statistically significant? {stat_significant}')
-        print(f'Is the test practically signficant ({practical_diff:.2%})? {practical_signficant}')      
- 
-        return stat_significant, practical_signficant
-
-    def test_mean(self, arr_exp, arr_ctrl, practical_diff=0.0, verbose=0):
+            logger.info('Sample size in treatment group: %d', N_exp)
+            logger.info('Observed probability in treatment group: %.2f%%', 100 * p_exp)
+            logger.info('Sample size in control group: %d', N_ctrl)
+            logger.info('Observed probability in control group: %.2f%%', 100 * p_ctrl)
+            logger.info('Observed difference in probability (treatment - control): %.2f%%', 100 * d_obs)
+            logger.info('Confidence interval for probability diff: (%.2f%%, %.2f%%)',
+                        100 * d_interval.lower, 100 * d_interval.upper)
+            logger.info('Is the test statistically significant? %s', stat_significant)
+            logger.info('Is the test practically signficant (%.2f%%)? %s', 100 * practical_diff, practical_signficant)
+
+        return ABResult(stat_significant, practical_signficant, d_obs, d_interval.lower, d_interval.upper)
+
+    def test_prob_batch(self, X_exp, X_ctrl, N_exp, N_ctrl, practical_diff=0.0):
+        """Perform A/B tests on probability for many metrics at once.
+
+        Equivalent to calling `test_prob` on each set of counts, but vectorized over metrics
+        and without printing.
+
+        Args:
+            X_exp (array-like): Number of positive in treatment group, one per metric.
+            X_ctrl (array-like): Number of positive in control group, one per metric.
+            N_exp (array-like): Total number of samples in treatment group, one per metric.
+            N_ctrl (array-like): Total number of samples in control group, one per metric.
+            practical_diff (float or array-like): Difference required to reach practical significance of the test.
+
+        Returns:
+            lower (np.ndarray): lower bounds of confidence intervals for probability diff.
+            upper (np.ndarray): upper bounds of confidence intervals for probability diff.
+            stat_significant (np.ndarray): Whether each difference is statistically significant.
+            practical_significant (np.ndarray): Whether each difference is practically significant.
+        """
+        X_exp, X_ctrl, N_exp, N_ctrl = np.broadcast_arrays(*map(np.asarray, (X_exp, X_ctrl, N_exp, N_ctrl)))
+        _check_counts(X_exp, X_ctrl, N_exp, N_ctrl)
+
+        _, _, d_obs, pooled_var = _prob_diff_kernel(X_exp, X_ctrl, N_exp, N_ctrl)
+        pooled_se = np.sqrt(pooled_var)
+
+        return self._get_batch_significance(d_obs, self._z_crit * pooled_se, practical_diff)
+
+    def test_mean_batch(self, N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl, practical_diff=0.0):
+        """Perform A/B tests on difference of two sample means for many metrics at once.
+
+        Equivalent to calling `test_mean_from_stats` on each set of summary statistics, but
+        vectorized over metrics, with all t critical values from a single `stdtrit` call, and
+        without logging.
+
+        Args:
+            N_exp (array-like): Total number of samples in treatment group, one per metric.
+            mu_exp (array-like): Sample mean of treatment group, one per metric.
+            var_exp (array-like): Sample variance (ddof=1) of treatment group, one per metric.
+            N_ctrl (array-like): Total number of samples in control group, one per metric.
+            mu_ctrl (array-like): Sample mean of control group, one per metric.
+            var_ctrl (array-like): Sample variance (ddof=1) of control group, one per metric.
+            practical_diff (float or array-like): Difference required to reach practical significance of the test.
+
+        Returns:
+            lower (np.ndarray): lower bounds of confidence intervals for mean diff.
+            upper (np.ndarray): upper bounds of confidence intervals for mean diff.
+            stat_significant (np.ndarray): Whether each difference is statistically significant.
+            practical_significant (np.ndarray): Whether each difference is practically significant.
+        """
+        N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl = np.broadcast_arrays(
+            *map(np.asarray, (N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl)))
+
+        degree_of_freedom = N_exp + N_ctrl - 2
+        d_obs = mu_exp - mu_ctrl
+        pooled_sd = np.sqrt(((N_exp - 1) * var_exp + (N_ctrl - 1) * var_ctrl) / degree_of_freedom)
+        pooled_se = pooled_sd * np.sqrt(1.0/N_exp + 1.0/N_ctrl)
+
+        t_abs = stdtrit(degree_of_freedom, self._conf_level)
+        return self._get_batch_significance(d_obs, t_abs * pooled_se, practical_diff)
+
+    def test_mean(self, arr_exp, arr_ctrl, practical_diff=0.0, verbose=0, cov_exp=None, cov_ctrl=None):
         """Perform A/B test on difference of two sample means.
+
+        Raw values are only needed to reduce each sample to its size, mean and variance;
+        use `test_mean_from_stats` directly when those are already available.
+        When pre-experiment covariates are given, the samples are CUPED-adjusted before
+        the test, which narrows the confidence interval by the variance the covariate explains.
         
         Args:
             arr_exp (array-like): Values of sample 1.
             arr_ctrl (array-like): Values of sample 2.
             practical_diff (float): Difference required to reach practical significance of the test.
-            verbose (int): Whether to print metrics and test stats.
+            verbose (int): Whether to log metrics and test stats at INFO level on the `experiment_utils.abtest`
+                logger. Nothing is shown unless logging is configured, e.g. `logging.basicConfig(level=logging.INFO)`.
+            cov_exp (array-like): Pre-experiment covariate of sample 1, e.g. the same metric before the experiment.
+            cov_ctrl (array-like): Pre-experiment covariate of sample 2.
+
+        Returns:
+            result (ABResult): Whether the difference is statistically and practically significant,
+                the observed difference and its confidence interval. Unpack the flags with
+                `result.stat_significant, result.practical_significant` or `result[:2]`.
+        """
+        # coerce once so the reductions below read contiguous memory without further copies
+        arr_exp = np.ascontiguousarray(arr_exp)
+        arr_ctrl = np.ascontiguousarray(arr_ctrl)
+        _check_sample_sizes(arr_exp.size, arr_ctrl.size)
+
+        if cov_exp is not None or cov_ctrl is not None:
+            if cov_exp is None or cov_ctrl is None:
+                raise ValueError("Covariates should be provided for both samples.")
+            arr_exp, arr_ctrl = _cuped_adjust(arr_exp, arr_ctrl, cov_exp, cov_ctrl)
+
+        N_exp, mu_exp, var_exp = _n_mean_var(arr_exp)
+        N_ctrl, mu_ctrl, var_ctrl = _n_mean_var(arr_ctrl)
+
+        # Bessel correction for sample variance; a single value has no spread to weight
+        var_exp = var_exp * N_exp / (N_exp - 1) if N_exp > 1 else 0.0
+        var_ctrl = var_ctrl * N_ctrl / (N_ctrl - 1) if N_ctrl > 1 else 0.0
+
+        return self.test_mean_from_stats(N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl,
+                                         practical_diff=practical_diff, verbose=verbose)
+
+    def test_mean_from_stats(self, N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl, practical_diff=0.0, verbose=0):
+        """Perform A/B test on difference of two sample means from summary statistics.
+
+        Statistics should be scalars; use `test_mean_batch` to test many metrics at once.
+        
+        Args:
+            N_exp (int): Total number of samples in treatment group.
+            mu_exp (float): Sample mean of treatment group.
+            var_exp (float): Sample variance (ddof=1) of treatment group.
+            N_ctrl (int): Total number of samples in control group.
+            mu_ctrl (float): Sample mean of control group.
+            var_ctrl (float): Sample variance (ddof=1) of control group.
+            practical_diff (float): Difference required to reach practical significance of the test.
+            verbose (int): Whether to log metrics and test stats at INFO level on the `experiment_utils.abtest`
+                logger. Nothing is shown unless logging is configured, e.g. `logging.basicConfig(level=logging.INFO)`.
 
         Returns:
-            stat_significant (bool): Whether the difference is statistically significant.
-            practical_significant (bool): Whether the difference is practically significant.
+            result (ABResult): Whether the difference is statistically and practically significant,
+                the observed difference and its confidence interval. Unpack the flags with
+                `result.stat_significant, result.practical_significant` or `result[:2]`.
         """
-        mu_exp, mu_ctrl = np.mean(arr_exp), np.mean(arr_ctrl)
-        N_exp, N_ctrl = len(arr_exp), len(arr_ctrl)
-        sd_exp, sd_ctrl = np.std(arr_exp), np.std(arr_ctrl)
+        if any(np.ndim(i) > 0 for i in (N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl)):
+            raise ValueError("Summary statistics should be scalars, use `test_mean_batch` for arrays.")
+        _check_sample_sizes(N_exp, N_ctrl)
 
+        degree_of_freedom = N_exp + N_ctrl - 2
         d_obs = mu_exp - mu_ctrl
-        pooled_sd = np.sqrt( ((N_exp - 1) * sd_exp**2 + (N_ctrl - 1) * sd_ctrl**2) / (N_exp + N_ctrl - 2 ) )
-        pooled_se = pooled_sd * np.sqrt(1/N_exp + 1/N_ctrl)
+        pooled_sd = sqrt( ((N_exp - 1) * var_exp + (N_ctrl - 1) * var_ctrl) / degree_of_freedom )
+        pooled_se = pooled_sd * sqrt(1/N_exp + 1/N_ctrl)
 
         d_interval = self._get_t_confidence_interval(point_estimate=d_obs, 
                                                     standard_error=pooled_se, 
-                                                    degree_of_freedom=N_exp + N_ctrl - 2)
+                                                    degree_of_freedom=degree_of_freedom)
 
         stat_significant = self._get_significance(d_interval, 0.0)
         practical_signficant = self._get_significance(d_interval, practical_diff)
 
         if verbose > 0:
-            print(f'Sample size in treatment group: {int(N_exp)}')
-            print(f'Observed mean in treatment group: {mu_exp:.4}\n')
-            print(f'Sample size in control group: {int(N_ctrl)}')
-            print(f'Observed mean in control group: {mu_ctrl:.4}\n')
-            print(f'Observed difference in mean (treatment - control): {d_obs:.4}')
-            print(f'Confidence interval for mean diff: ({d_interval.lower:.4}, {d_interval.upper:.4})\n')
-
-        print(f'Is the test statistically significant? {stat_significant}')
-        print(f'Is the test practically signficant ({practical_diff:.4})? {practical_signficant}')      
- 
-        return stat_significant, practical_signficant
+            logger.info('Sample size in treatment group: %d', N_exp)
+            logger.info('Observed mean in treatment group: %.4g', mu_exp)
+            logger.info('Sample size in control group: %d', N_ctrl)
+            logger.info('Observed mean in control group: %.4g', mu_ctrl)
+            logger.info('Observed difference in mean (treatment - control): %.4g', d_obs)
+            logger.info('Confidence interval for mean diff: (%.4g, %.4g)', d_interval.lower, d_interval.upper)
+            logger.info('Is the test statistically significant? %s', stat_significant)
+            logger.info('Is the test practically signficant (%.4g)? %s', practical_diff, practical_signficant)
+
+        return ABResult(stat_significant, practical_signficant, d_obs, d_interval.lower, d_interval.upper)
 
         
\ No newline at end of file
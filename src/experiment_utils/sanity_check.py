@@ -1,19 +1,121 @@
 """Utilities to perform sanity check."""
 
+from functools import lru_cache
+
 import numpy as np
 
-def bootstrap(arr, n):
+# minimum number of bootstrapped values (n * len(arr)) to use the numba kernel
+_NUMBA_BOOTSTRAP_THRESHOLD = 10**7
+
+
+@lru_cache(maxsize=None)
+def _get_bootstrap_kernel():
+    """Compile the parallel bootstrap kernel, or return None if numba is not installed."""
+    try:
+        from numba import njit
+        from numba import prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _bootstrap_kernel(arr, out, n, m):
+        for i in prange(n):
+            for j in range(m):
+                out[i, j] = arr[np.random.randint(0, m)]
+
+    return _bootstrap_kernel
+
+
+def _get_num_threads():
+    """Return the number of threads numba runs parallel kernels on."""
+    from numba import get_num_threads
+
+    return get_num_threads()
+
+
+def bootstrap(arr, n, rng=None, seed=None):
     """Bootstrap sample by a given times.
     
+    Large numeric samples are bootstrapped in parallel with numba when it is
+    installed, it runs on more than one thread, and neither `rng` nor `seed`
+    is given, since the numba kernel draws from its own per-thread random state.
+
     Args:
         arr (array-like): original sample.
         n (int): Number of bootstrapped samples.
+        rng (np.random.Generator): Random generator to draw samples from. Created from `seed` if not provided.
+        seed (int): Seed for the random generator, ignored when `rng` is provided.
     
     Return:
-        bootstrapped (list): list of bootstrapped samples.
+        bootstrapped (np.ndarray): 2-D array of shape (n, len(arr)), one bootstrapped sample per row.
+    """
+    arr = np.ascontiguousarray(arr)
+    m = len(arr)
+
+    if rng is None and seed is None and n * m > _NUMBA_BOOTSTRAP_THRESHOLD and arr.dtype.kind in "biuf":
+        kernel = _get_bootstrap_kernel()
+        if kernel is not None and _get_num_threads() > 1:
+            bootstrapped = np.empty((n, m), dtype=arr.dtype)
+            kernel(arr, bootstrapped, n, m)
+            return bootstrapped
+
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    idx = rng.integers(0, m, size=(n, m))
+
+    return arr[idx]
+
+
+def bootstrap_iter(arr, n, rng=None, seed=None):
+    """Yield bootstrapped samples one at a time.
+
+    Unlike `bootstrap`, only one sample is held in memory at a time.
+
+    Args:
+        arr (array-like): original sample.
+        n (int): Number of bootstrapped samples.
+        rng (np.random.Generator): Random generator to draw samples from. Created from `seed` if not provided.
+        seed (int): Seed for the random generator, ignored when `rng` is provided.
+
+    Yield:
+        sample (np.ndarray): bootstrapped sample of length len(arr).
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    arr = np.asarray(arr)
+    m = len(arr)
+    for _ in range(n):
+        yield arr[rng.integers(0, m, size=m)]
+
+
+def bootstrap_stat(arr, n, stat_fn, rng=None, seed=None):
+    """Estimate mean and variance of a statistic over bootstrapped samples.
+
+    The running mean and variance are accumulated with Welford's algorithm,
+    so the bootstrapped samples are never materialized together.
+
+    Args:
+        arr (array-like): original sample.
+        n (int): Number of bootstrapped samples.
+        stat_fn (callable): Statistic computed on each bootstrapped sample, e.g. np.mean.
+        rng (np.random.Generator): Random generator to draw samples from. Created from `seed` if not provided.
+        seed (int): Seed for the random generator, ignored when `rng` is provided.
+
+    Return:
+        mean (float): mean of the statistic over bootstrapped samples.
+        var (float): sample variance of the statistic over bootstrapped samples.
     """
-    bootstrapped = []
-    for i in range(n):
-        bootstrapped.append(np.random.choice(arr, size=len(arr), replace=True))
+    if n < 1:
+        raise ValueError("Number of bootstrapped samples should be at least 1.")
+
+    mean, m2 = 0.0, 0.0
+    for k, sample in enumerate(bootstrap_iter(arr, n, rng=rng, seed=seed), start=1):
+        value = stat_fn(sample)
+        delta = value - mean
+        mean = mean + delta / k
+        m2 = m2 + delta * (value - mean)
 
-    return bootstrapped
+    var = m2 / (n - 1) if n > 1 else np.nan
+    return mean, var
@@ -0,0 +1,196 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from experiment_utils.abtest import ABTest
+from experiment_utils.abtest import _n_mean_var
+
+TEST_TYPES = ["two-tailed", "right-tailed", "left-tailed"]
+
+
+def _pooled_t_confidence_interval(arr_exp, arr_ctrl, alpha=0.05):
+    """Two-tailed pooled-variance CI for the difference in means, from scipy.stats.t.ppf."""
+    N_exp, N_ctrl = len(arr_exp), len(arr_ctrl)
+    degree_of_freedom = N_exp + N_ctrl - 2
+    pooled_var = ((N_exp - 1) * np.var(arr_exp, ddof=1) + (N_ctrl - 1) * np.var(arr_ctrl, ddof=1)) / degree_of_freedom
+    margin = stats.t.ppf(1 - alpha/2, degree_of_freedom) * np.sqrt(pooled_var * (1/N_exp + 1/N_ctrl))
+    d_obs = np.mean(arr_exp) - np.mean(arr_ctrl)
+    return d_obs - margin, d_obs + margin
+
+
+@pytest.mark.parametrize("degree_of_freedom", [1, 5, 30, 1000])
+def test_t_confidence_interval_one_tailed(degree_of_freedom):
+    t_abs = stats.t.ppf(0.95, degree_of_freedom)
+
+    right = ABTest(type="right-tailed")._get_t_confidence_interval(1.0, 2.0, degree_of_freedom)
+    assert right.lower == -np.inf
+    assert right.upper == pytest.approx(1.0 + 2.0 * t_abs)
+
+    left = ABTest(type="left-tailed")._get_t_confidence_interval(1.0, 2.0, degree_of_freedom)
+    assert left.lower == pytest.approx(1.0 - 2.0 * t_abs)
+    assert left.upper == np.inf
+
+
+@pytest.mark.parametrize("degree_of_freedom", [1, 5, 30, 1000])
+def test_t_confidence_interval_two_tailed(degree_of_freedom):
+    t_abs = stats.t.ppf(0.975, degree_of_freedom)
+    ci = ABTest()._get_t_confidence_interval(1.0, 2.0, degree_of_freedom)
+    assert ci.lower == pytest.approx(1.0 - 2.0 * t_abs)
+    assert ci.upper == pytest.approx(1.0 + 2.0 * t_abs)
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e8])
+def test_mean_confidence_interval(offset):
+    rng = np.random.default_rng(0)
+    arr_ctrl = offset + rng.standard_normal(500)
+    arr_exp = arr_ctrl + 0.3 + rng.standard_normal(500)
+
+    result = ABTest().test_mean(arr_exp, arr_ctrl)
+    assert (result.ci_lower, result.ci_upper) == pytest.approx(_pooled_t_confidence_interval(arr_exp, arr_ctrl))
+
+
+def test_n_mean_var_large_offset():
+    arr = 1e9 + np.random.default_rng(4).standard_normal(10000)
+    n, mean, var = _n_mean_var(arr)
+    assert n == arr.size
+    assert mean == pytest.approx(np.mean(arr))
+    assert var == pytest.approx(np.var(arr), rel=1e-6)
+
+
+def test_mean_single_value_group():
+    arr_ctrl = np.random.default_rng(2).standard_normal(20)
+    result = ABTest().test_mean([5.0], arr_ctrl)
+    assert np.isfinite(result.ci_lower) and np.isfinite(result.ci_upper)
+
+
+@pytest.mark.parametrize("arr_exp, arr_ctrl", [([1.0], [2.0]), ([], [1.0, 2.0, 3.0])])
+def test_mean_too_few_samples(arr_exp, arr_ctrl):
+    with pytest.raises(ValueError):
+        ABTest().test_mean(arr_exp, arr_ctrl)
+
+
+def test_mean_from_stats():
+    rng = np.random.default_rng(1)
+    arr_exp, arr_ctrl = rng.normal(1.0, 2.0, 80), rng.normal(0.5, 1.0, 120)
+    ab = ABTest()
+
+    result = ab.test_mean_from_stats(arr_exp.size, arr_exp.mean(), arr_exp.var(ddof=1),
+                                     arr_ctrl.size, arr_ctrl.mean(), arr_ctrl.var(ddof=1))
+    assert (result.ci_lower, result.ci_upper) == pytest.approx(_pooled_t_confidence_interval(arr_exp, arr_ctrl))
+    assert result == pytest.approx(ab.test_mean(arr_exp, arr_ctrl))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.int32, np.bool_])
+def test_n_mean_var_narrow_dtype(dtype):
+    arr = (np.random.default_rng(3).random(10000) * 3).astype(dtype)
+    n, mean, var = _n_mean_var(arr)
+    assert n == arr.size
+    assert mean == pytest.approx(arr.astype(np.float64).mean(), rel=1e-5)
+    assert var == pytest.approx(arr.astype(np.float64).var(), rel=1e-5)
+
+
+@pytest.mark.parametrize("type", TEST_TYPES)
+def test_prob_batch_matches_loop(type):
+    ab = ABTest(type=type)
+    X_exp, X_ctrl = np.array([200, 100, 50, 0]), np.array([100, 100, 100, 3])
+    N_exp, N_ctrl = np.array([1000, 1000, 1000, 500]), np.array([1000, 1000, 900, 500])
+
+    lower, upper, stat_significant, practical_significant = ab.test_prob_batch(
+        X_exp, X_ctrl, N_exp, N_ctrl, practical_diff=0.05)
+    for i in range(4):
+        result = ab.test_prob(X_exp[i], X_ctrl[i], N_exp[i], N_ctrl[i], practical_diff=0.05)
+        assert (lower[i], upper[i]) == pytest.approx((result.ci_lower, result.ci_upper))
+        assert (stat_significant[i], practical_significant[i]) == result[:2]
+
+    if type == "two-tailed":
+        np.testing.assert_array_equal(stat_significant, [True, False, True, False])
+
+
+# The one-tailed CI helpers put the infinite bound on the wrong side: "right-tailed" builds
+# (-inf, upper) but `_get_significance` checks `lower > benchmark`, and "left-tailed" builds
+# (lower, inf) but checks `upper < benchmark`, so one-tailed tests are never significant.
+@pytest.mark.xfail(strict=True, reason="one-tailed confidence interval bounds are inverted")
+@pytest.mark.parametrize("type, X_exp, X_ctrl", [("right-tailed", 200, 100), ("left-tailed", 100, 200)])
+def test_prob_one_tailed_significant(type, X_exp, X_ctrl):
+    ab = ABTest(type=type)
+    assert ab.test_prob(X_exp, X_ctrl, 1000, 1000).stat_significant
+    assert ab.test_prob_batch([X_exp], [X_ctrl], 1000, 1000)[2].all()
+
+
+@pytest.mark.parametrize("counts", [
+    (-1, 1, 10, 10),
+    (1.5, 1, 10, 10),
+    (float("nan"), 1, 10, 10),
+    (float("inf"), 1, 10, 10),
+    (11, 1, 10, 10),
+])
+def test_prob_invalid_counts(counts):
+    ab = ABTest()
+    with pytest.raises(ValueError):
+        ab.test_prob(*counts)
+    with pytest.raises(ValueError):
+        ab.test_prob_batch(*counts)
+
+
+def test_prob_count_types():
+    ab = ABTest()
+    expected = ab.test_prob(3, 1, 10, 10)
+    assert ab.test_prob(np.int32(3), np.uint8(1), 10.0, np.int64(10)) == pytest.approx(expected)
+    assert ab.test_prob(3, 1, 2**64, 2**64).d_obs == pytest.approx(2 / 2**64)
+    with pytest.raises(ValueError):
+        ab.test_prob_batch(3, 1, 2**64, 2**64)
+
+
+def test_prob_result(caplog):
+    with caplog.at_level("INFO", logger="experiment_utils.abtest"):
+        result = ABTest().test_prob(200, 100, 1000, 1000)
+        assert not caplog.records
+        ABTest().test_prob(200, 100, 1000, 1000, verbose=1)
+        assert caplog.records
+
+    stat_significant, practical_significant = result[:2]
+    assert stat_significant and practical_significant
+    assert result.d_obs == pytest.approx(0.1)
+    assert result.ci_lower < 0.1 < result.ci_upper
+
+
+def test_mean_cuped():
+    rng = np.random.default_rng(5)
+    cov_exp, cov_ctrl = 1e8 + rng.normal(0, 3, 2000), 1e8 + rng.normal(0, 3, 2000)
+    arr_exp = (cov_exp - 1e8) + rng.normal(0.2, 1, 2000)
+    arr_ctrl = (cov_ctrl - 1e8) + rng.normal(0.0, 1, 2000)
+    ab = ABTest()
+
+    plain = ab.test_mean(arr_exp, arr_ctrl)
+    adjusted = ab.test_mean(arr_exp, arr_ctrl, cov_exp=cov_exp, cov_ctrl=cov_ctrl)
+    assert adjusted.ci_upper - adjusted.ci_lower < 0.5 * (plain.ci_upper - plain.ci_lower)
+    assert adjusted.ci_lower < 0.2 < adjusted.ci_upper
+
+
+@pytest.mark.parametrize("cov_exp, cov_ctrl", [([1.0, 2.0], None), ([1.0], [1.0, 2.0]), ([1.0, 1.0], [1.0, 1.0])])
+def test_mean_cuped_invalid_covariates(cov_exp, cov_ctrl):
+    with pytest.raises(ValueError):
+        ABTest().test_mean([1.0, 2.0], [1.0, 3.0], cov_exp=cov_exp, cov_ctrl=cov_ctrl)
+
+
+@pytest.mark.parametrize("type", TEST_TYPES)
+def test_mean_batch_matches_loop(type):
+    ab = ABTest(type=type)
+    N_exp, mu_exp, var_exp = np.array([20, 50, 400]), np.array([1.0, 1.2, 1.4]), np.array([1.0, 0.5, 2.0])
+    N_ctrl, mu_ctrl, var_ctrl = np.array([30, 40, 500]), np.array([1.0, 1.0, 1.0]), np.array([1.0, 0.8, 2.0])
+
+    lower, upper, stat_significant, practical_significant = ab.test_mean_batch(
+        N_exp, mu_exp, var_exp, N_ctrl, mu_ctrl, var_ctrl, practical_diff=0.05)
+    for i in range(3):
+        result = ab.test_mean_from_stats(N_exp[i], mu_exp[i], var_exp[i], N_ctrl[i], mu_ctrl[i], var_ctrl[i],
+                                         practical_diff=0.05)
+        assert (lower[i], upper[i]) == pytest.approx((result.ci_lower, result.ci_upper))
+        assert (stat_significant[i], practical_significant[i]) == result[:2]
+
+    if type == "two-tailed":
+        np.testing.assert_array_equal(stat_significant, [False, False, True])
+
+
+def test_mean_from_stats_rejects_arrays():
+    with pytest.raises(ValueError):
+        ABTest().test_mean_from_stats([10, 20], [1.0, 2.0], [1.0, 1.0], 10, 1.0, 1.0)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from experiment_utils import sanity_check
+from experiment_utils.sanity_check import bootstrap
+from experiment_utils.sanity_check import bootstrap_iter
+from experiment_utils.sanity_check import bootstrap_stat
+
+
+def test_bootstrap():
+    arr = [1, 2, 3, 4]
+    bootstrapped = bootstrap(arr, 5, seed=0)
+    assert bootstrapped.shape == (5, 4)
+    assert np.isin(bootstrapped, arr).all()
+    np.testing.assert_array_equal(bootstrapped, bootstrap(arr, 5, rng=np.random.default_rng(0)))
+
+
+def test_bootstrap_kernel():
+    pytest.importorskip("numba")
+
+    arr = np.arange(10, dtype=np.float64)
+    bootstrapped = np.empty((50, 10))
+    sanity_check._get_bootstrap_kernel()(arr, bootstrapped, 50, 10)
+    assert np.isin(bootstrapped, arr).all()
+
+
+@pytest.mark.parametrize("num_threads, seed, uses_kernel", [(2, None, True), (1, None, False), (2, 0, False)])
+def test_bootstrap_kernel_dispatch(monkeypatch, num_threads, seed, uses_kernel):
+    calls = []
+
+    def kernel(arr, out, n, m):
+        calls.append(n)
+        out[:] = arr[0]
+
+    monkeypatch.setattr(sanity_check, "_NUMBA_BOOTSTRAP_THRESHOLD", 0)
+    monkeypatch.setattr(sanity_check, "_get_bootstrap_kernel", lambda: kernel)
+    monkeypatch.setattr(sanity_check, "_get_num_threads", lambda: num_threads)
+
+    bootstrapped = bootstrap(np.arange(10.0), 5, seed=seed)
+    assert bootstrapped.shape == (5, 10)
+    assert bool(calls) == uses_kernel
+
+
+def test_bootstrap_iter():
+    arr = [1, 2, 3, 4]
+    samples = list(bootstrap_iter(arr, 5, seed=0))
+    assert len(samples) == 5
+    assert all(sample.shape == (4,) and np.isin(sample, arr).all() for sample in samples)
+
+
+def test_bootstrap_stat():
+    arr = np.random.default_rng(1).random(100)
+    stats = [sample.mean() for sample in bootstrap_iter(arr, 200, seed=2)]
+
+    mean, var = bootstrap_stat(arr, 200, np.mean, seed=2)
+    assert mean == pytest.approx(np.mean(stats))
+    assert var == pytest.approx(np.var(stats, ddof=1))
+
+
+def test_bootstrap_stat_no_samples():
+    with pytest.raises(ValueError):
+        bootstrap_stat([1, 2, 3], 0, np.mean)